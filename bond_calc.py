@@ -5,9 +5,14 @@ This script allows the user to calculate the Yield-to-Maturity, Price, Duration,
 It is operated purely through a Command Line Interface (CLI).
 """
 
-from pyfiglet import Figlet
-import numpy as np
-from scipy.optimize import newton
+import argparse
+import sys
+from typing import TYPE_CHECKING
+
+from bond_math import duration_convexity, npv_cash_flows, solve_ytm
+
+if TYPE_CHECKING: # NumPy is imported inside the batch functions at runtime
+    import numpy as np
 
 __author__ = "Shreyas V. Srinivasan"
 __credits__ = ["Shreyas V. Srinivasan", "Deborah J. Lucas"]
@@ -17,58 +22,14 @@ __maintainer__ = "Shreyas V. Srinivasan"
 __email__ = "shreyass@alum.mit.edu"
 __status__ = "Production"
 
+_BANNER = r"""
+    ____                  __   ______      __           __      __
+   / __ )____  ____  ____/ /  / ____/___ _/ /______  __/ /___ _/ /_____  _____
+  / __  / __ \/ __ \/ __  /  / /   / __ `/ / ___/ / / / / __ `/ __/ __ \/ ___/
+ / /_/ / /_/ / / / / /_/ /  / /___/ /_/ / / /__/ /_/ / / /_/ / /_/ /_/ / /
+/_____/\____/_/ /_/\__,_/   \____/\__,_/_/\___/\__,_/_/\__,_/\__/\____/_/
 
-def _weighted_cash_flows(coefficients : np.array, coupon : float = 0.0, face : float = 100.00, freq : int = 1, maturity : int = 1) -> float:
-    """Calculates the weighted average of a series of bond cash flows.
-
-    Parameters
-    ----------
-    coefficients : np.array
-        Coefficients by which to weight the bond's cash flows when taking the average.
-    coupon : float = 0.0
-        The annual coupon rate of the bond.
-    face : float = 100.00
-        The bond's face value.
-    freq : int = 1
-        The number of compounding periods in a year.
-    maturity : int = 1
-        The bond's maturity, in years.
-
-    Returns
-    -------
-    float
-        The weighted average of a series of bond cash flows.
-    """
-
-    cf = np.array([(coupon/freq)*face] * (freq*maturity)) # Compute nominal future cash flows
-    cf[-1] += face # Account for principal repayment in last period
-
-    return np.dot(cf, coefficients)
-
-
-def _npv_cash_flows(discount: float = 0.0, coupon: float = 0.0, face: float = 100.00, nper: int = 1) -> float:
-    """Calculates the net present value of a bond's cash flows.
-
-    Parameters
-    ----------
-    discount : float = 0.0
-        The discount rate for the cash flows (equivalently, the bond's yield)
-    coupon : float = 0.0
-        The per-period coupon rate of the bond.
-    face : float = 100.00
-        The bond's face value, or principal amount repaid at maturity.
-    nper : int = 1
-        The number of payment periods.
-
-    Returns
-    -------
-    float
-        The present value (PV) of the bond's cash flows.
-    """
-
-    coefficients = np.fromfunction(lambda i: 1/(1 + discount)**(i + 1), (nper,), dtype=int)
-
-    return _weighted_cash_flows(coefficients=coefficients, coupon=coupon, face=face, maturity=nper)
+""".lstrip("\n") # Figlet(font='slant').renderText('Bond Calculator'), pre-rendered to avoid importing pyfiglet at startup
 
 
 def _ytm() -> float:
@@ -87,7 +48,7 @@ def _ytm() -> float:
     face = float(input("> Face value: $"))
     coupon = float(input("> Coupon %age per period (enter as number, e.g., '5' for 5%): "))/100
 
-    return newton(lambda y: _npv_cash_flows(y, coupon, face, nper) - price, 0.05) # Use Newton's method to equate cash flows (as function of YTM) to price
+    return solve_ytm(price, coupon, face, nper)
 
 
 def _price() -> float:
@@ -107,65 +68,70 @@ def _price() -> float:
     freq = int(input("> Coupon payments per year: "))
     years = int(input("> Years to maturity: "))
 
-    return _npv_cash_flows(apr/freq, coupon/freq, face, freq*years)
+    return npv_cash_flows(apr/freq, coupon/freq, face, freq*years)
 
 
-def _macaulay_duration(apr : float = 0.0, coupon : float = 0.0, face : float = 100.00, freq : int = 1, maturity : int = 1, price : float = 100.00) -> float:
-    """Calculates the Macaulay Duration of a bond.
+def _cash_flows_batch(discount : 'np.ndarray', coupon : 'np.ndarray', face : 'np.ndarray', nper : 'np.ndarray') -> 'np.ndarray':
+    """Calculates the net present values of the cash flows of many bonds at once.
 
     Parameters
     ----------
-    apr : float = 0.0
-        The bond's APR, or the value y in the Macaulay Duration formula.
-    coupon : float = 0.0
-        The annual coupon rate of the bond.
-    face : float = 100.00
-        The bond's face value.
-    freq : int = 1
-        The number of compounding periods in a year, or the value k in the Macaulay Duration formula.
-    maturity : int = 1
-        The bond's maturity, in years.
-    price : float = 100.00
-        The bond price, the value P_B in the Macaulay Duration formula.
+    discount : np.ndarray
+        The per-period discount rate of each bond.
+    coupon : np.ndarray
+        The per-period coupon rate of each bond.
+    face : np.ndarray
+        The face value of each bond.
+    nper : np.ndarray
+        The number of payment periods of each bond.
 
     Returns
     -------
-    float
-        The Macaulay Duration of the bond.
+    np.ndarray
+        The present value (PV) of each bond's cash flows.
     """
 
-    coefficients = np.fromfunction(lambda t: ((t+1)/freq)*((1 + (apr/freq))**(-(t+1)))/price, (freq*maturity,), dtype=int) # Compute weighting for CFs from Macaulay Duration formula
+    import numpy as np # Deferred so that single-bond calculations, which are pure Python, do not pay for importing NumPy
+
+    nper = np.asarray(nper, dtype=np.int64)
+    if nper.size == 0:
+        return np.empty(0, dtype=np.float64)
+    nper_max = int(nper.max())
+    v = 1/(1 + np.asarray(discount, dtype=np.float64))
+    factors = np.empty((v.size, nper_max + 1), dtype=np.float64)
+    factors[:, 0] = 1.0 # v^0, so that column t holds v^t and bonds with nper = 0 are not discounted
+    factors[:, 1:] = v[:, None]
+    np.cumprod(factors, axis=1, out=factors) # Discount factors v^t, one row per bond
+    vn = factors[np.arange(v.size), nper]
+    factors[np.arange(nper_max + 1) > nper[:, None]] = 0.0 # Ignore periods beyond each bond's maturity, in place
+    annuity = factors[:, 1:].sum(axis=1)
 
-    return _weighted_cash_flows(coefficients, coupon, face, freq, maturity)
+    return coupon*face*annuity + face*vn # Level coupon annuity plus discounted principal
 
 
-def _convexity(apr : float = 0.0, coupon : float = 0.0, face : float = 100.00, freq : int = 1, maturity : int = 1, price : float = 100.00) -> float:
-    """Calculates the convexity of an option-free bond.
+def price_bonds(df) -> 'np.ndarray':
+    """Calculates the prices of a portfolio of bonds.
 
     Parameters
     ----------
-    apr : float = 0.0
-        The bond's APR, or the value y in the Macaulay Duration formula.
-    coupon : float = 0.0
-        The annual coupon rate of the bond.
-    face : float = 100.00
-        The bond's face value.
-    freq : int = 1
-        The number of compounding periods in a year, or the value k in the Macaulay Duration formula.
-    maturity : int = 1
-        The bond's maturity, in years.
-    price : float = 100.00
-        The bond price, the value P_B in the Macaulay Duration formula.
+    df : pandas.DataFrame
+        One row per bond, with columns 'face' (face value), 'apr' (APR as a decimal), 'coupon' (annual coupon rate as a decimal), 'freq' (coupon payments per year), and 'maturity' (years to maturity).
 
     Returns
     -------
-    float
-        The convexity of the bond.
+    np.ndarray
+        The price of each bond, in the order of the rows of df.
     """
 
-    coefficients = np.fromfunction(lambda t: (((t+1)*(t+2))/((1 + (apr/freq))**(t+3)*(freq**2)))/price, (freq*maturity,), dtype=int) # Compute weighting for CFs from Convexity formula
+    import numpy as np
+
+    face = df['face'].to_numpy(dtype=np.float64)
+    apr = df['apr'].to_numpy(dtype=np.float64)
+    coupon = df['coupon'].to_numpy(dtype=np.float64)
+    freq = df['freq'].to_numpy(dtype=np.int64)
+    maturity = df['maturity'].to_numpy(dtype=np.int64)
 
-    return _weighted_cash_flows(coefficients, coupon, face, freq, maturity)
+    return _cash_flows_batch(apr/freq, coupon/freq, face, freq*maturity)
 
 
 def _duration_convexity() -> tuple:
@@ -185,17 +151,90 @@ def _duration_convexity() -> tuple:
     face = float(input("> Face value: $"))
     yld = float(input("> Bond Equivalent Yield (enter as number, e.g., '5' for 5%): "))/100
 
-    price = _npv_cash_flows(yld/freq, coupon/freq, face, freq*n)
+    return duration_convexity(yld, coupon, face, freq, n)
+
+
+def _parse_args(argv : list) -> argparse.Namespace:
+    """Parses command line arguments for non-interactive use.
+
+    Parameters
+    ----------
+    argv : list
+        The command line arguments, excluding the program name.
+
+    Returns
+    -------
+    argparse.Namespace
+        The selected calculation and all of its parameters. Rates are converted from percentages to decimals.
+    """
+
+    parser = argparse.ArgumentParser(description="Computes bond YTM, price, duration, or convexity.")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    ytm = subparsers.add_parser('ytm', help="Yield to Maturity")
+    ytm.add_argument('--price', type=float, required=True, help="bond price")
+    ytm.add_argument('--nper', type=int, required=True, help="number of payment periods")
+    ytm.add_argument('--face', type=float, default=100.00, help="face value (default: 100)")
+    ytm.add_argument('--coupon', type=float, default=0.0, help="coupon %%age per period, e.g., '5' for 5%% (default: 0)")
 
-    d = _macaulay_duration(yld, coupon, face, freq, n, price)
-    d_m = d/(1 + (yld/freq))
-    c_0 = _convexity(yld, coupon, face, freq, n, price)
-    return d, d_m, c_0
+    price = subparsers.add_parser('price', help="Price")
+    price.add_argument('--face', type=float, default=100.00, help="face value (default: 100)")
+    price.add_argument('--apr', type=float, required=True, help="APR, e.g., '5' for 5%%")
+    price.add_argument('--coupon', type=float, default=0.0, help="annual coupon rate, e.g., '5' for 5%% (default: 0)")
+    price.add_argument('--freq', type=int, default=1, help="coupon payments per year (default: 1)")
+    price.add_argument('--maturity', type=int, required=True, help="years to maturity")
+
+    duration = subparsers.add_parser('duration', help="Duration & Convexity")
+    duration.add_argument('--maturity', type=int, required=True, help="years to maturity")
+    duration.add_argument('--freq', type=int, default=1, help="coupon payments per year (default: 1)")
+    duration.add_argument('--coupon', type=float, default=0.0, help="annual coupon rate, e.g., '5' for 5%% (default: 0)")
+    duration.add_argument('--face', type=float, default=100.00, help="face value (default: 100)")
+    duration.add_argument('--yield', dest='yld', type=float, required=True, help="bond equivalent yield, e.g., '5' for 5%%")
+
+    batch = subparsers.add_parser('batch', help="Price every bond in a CSV file")
+    batch.add_argument('csv', help="CSV file with columns face, apr, coupon, freq, maturity (rates as numbers, e.g., '5' for 5%%)")
+
+    args = parser.parse_args(argv)
+    for rate in ('coupon', 'apr', 'yld'):
+        if hasattr(args, rate):
+            setattr(args, rate, getattr(args, rate)/100)
+
+    return args
+
+
+def _run(args : argparse.Namespace) -> None:
+    """Runs a single calculation from parsed command line arguments and prints the result.
+
+    Parameters
+    ----------
+    args : argparse.Namespace
+        The output of _parse_args.
+    """
+
+    if args.command == 'ytm':
+        print("Yield to Maturity: {:.2f}%".format(100*solve_ytm(args.price, args.coupon, args.face, args.nper)))
+    elif args.command == 'price':
+        print("Price: ${:.2f}".format(npv_cash_flows(args.apr/args.freq, args.coupon/args.freq, args.face, args.freq*args.maturity)))
+    elif args.command == 'duration':
+        d, d_m, c_0 = duration_convexity(args.yld, args.coupon, args.face, args.freq, args.maturity)
+        print("Macaulay Duration: {:.4f}".format(d))
+        print("Modified Duration: {:.4f}".format(d_m))
+        print("Convexity: {:.4f}".format(c_0))
+    elif args.command == 'batch':
+        import pandas as pd # Only needed to read the CSV file
+
+        df = pd.read_csv(args.csv, dtype={'face': float, 'apr': float, 'coupon': float, 'freq': int, 'maturity': int})
+        df[['apr', 'coupon']] /= 100 # Same percentage convention as the other commands; price_bonds takes decimals
+        for p in price_bonds(df):
+            print("{:.2f}".format(p))
 
 
 if __name__ == '__main__':
-    f = Figlet(font='slant')
-    print(f.renderText('Bond Calculator'))
+    if len(sys.argv) > 1: # Non-interactive mode: compute once from arguments and exit
+        _run(_parse_args(sys.argv[1:]))
+        sys.exit()
+
+    print(_BANNER)
 
     exit = False
     while(not exit):
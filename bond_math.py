@@ -0,0 +1,259 @@
+"""Scalar bond math used by the Bond Calculator.
+
+This module computes the price, Yield-to-Maturity, Duration, and Convexity of a single level-coupon bond.
+It uses only the Python standard library, so it also runs under PyPy.
+"""
+
+__author__ = "Shreyas V. Srinivasan"
+__credits__ = ["Shreyas V. Srinivasan", "Deborah J. Lucas"]
+
+__version__ = "1.2.4"
+__maintainer__ = "Shreyas V. Srinivasan"
+__email__ = "shreyass@alum.mit.edu"
+__status__ = "Production"
+
+_CLOSED_FORM_MIN_RATE_NPER = 0.1 # Below this |discount*nper|, annuity factors are summed term by term
+
+
+def _annuity_series(discount : float = 0.0, nper : int = 1) -> tuple:
+    """Sums the discount factors of a level annuity term by term.
+
+    Parameters
+    ----------
+    discount : float = 0.0
+        The per-period discount rate.
+    nper : int = 1
+        The number of payment periods.
+
+    Returns
+    -------
+    tuple
+        v^nper and the sums of v^t, t*v^t, and t*(t+1)*v^t for t = 1, ..., nper, in this order, where v = 1/(1 + discount).
+    """
+
+    v = 1/(1 + discount)
+    vt = 1.0 # Running discount factor v^t, updated by one multiplication per period instead of a pow
+    w = 0 # Running weight t*(t+1), updated by adding 2*t per period
+    a, a_t, a_tt = 0.0, 0.0, 0.0
+    for t in range(1, nper + 1):
+        vt *= v
+        w += 2*t
+        a += vt
+        a_t += t*vt
+        a_tt += w*vt
+
+    return vt, a, a_t, a_tt
+
+
+def _annuity_factors(discount : float = 0.0, nper : int = 1) -> tuple:
+    """Calculates the discount factor and (weighted) present values of a level annuity paying 1 per period.
+
+    Parameters
+    ----------
+    discount : float = 0.0
+        The per-period discount rate.
+    nper : int = 1
+        The number of payment periods.
+
+    Returns
+    -------
+    tuple
+        v^nper and the sums of v^t, t*v^t, and t*(t+1)*v^t for t = 1, ..., nper, in this order, where v = 1/(1 + discount).
+    """
+
+    if abs(discount*nper) < _CLOSED_FORM_MIN_RATE_NPER: # Closed form cancels catastrophically as discount -> 0
+        return _annuity_series(discount, nper)
+
+    inv_discount = 1/discount # Divide once, then multiply
+    vn = (1 + discount)**(-nper)
+    a = (1 - vn)*inv_discount
+    a_t = ((1 + discount)*a - nper*vn)*inv_discount # Arithmetico-geometric series
+    a_tt = (2*(1 + discount)*a_t - nper*(nper + 1)*vn)*inv_discount
+
+    return vn, a, a_t, a_tt
+
+
+def npv_cash_flows(discount: float = 0.0, coupon: float = 0.0, face: float = 100.00, nper: int = 1) -> float:
+    """Calculates the net present value of a bond's cash flows.
+
+    Parameters
+    ----------
+    discount : float = 0.0
+        The discount rate for the cash flows (equivalently, the bond's yield)
+    coupon : float = 0.0
+        The per-period coupon rate of the bond.
+    face : float = 100.00
+        The bond's face value, or principal amount repaid at maturity.
+    nper : int = 1
+        The number of payment periods.
+
+    Returns
+    -------
+    float
+        The present value (PV) of the bond's cash flows.
+    """
+
+    vn, a, _, _ = _annuity_factors(discount, nper)
+
+    return coupon*face*a + face*vn # Level coupon annuity plus discounted principal
+
+
+def npv_and_derivatives(discount: float = 0.0, coupon: float = 0.0, face: float = 100.00, nper: int = 1) -> tuple:
+    """Calculates the net present value of a bond's cash flows and its first two derivatives with respect to the discount rate.
+
+    Parameters
+    ----------
+    discount : float = 0.0
+        The discount rate for the cash flows (equivalently, the bond's yield)
+    coupon : float = 0.0
+        The per-period coupon rate of the bond.
+    face : float = 100.00
+        The bond's face value, or principal amount repaid at maturity.
+    nper : int = 1
+        The number of payment periods.
+
+    Returns
+    -------
+    tuple
+        The bond's PV and its first and second derivatives with respect to the discount rate, in this order.
+    """
+
+    vn, a, a_t, a_tt = _annuity_factors(discount, nper) # Shared by the PV and both derivatives
+    v = 1/(1 + discount)
+
+    pv = coupon*face*a + face*vn
+    dpv = -(coupon*face*a_t + nper*face*vn)*v
+    d2pv = (coupon*face*a_tt + nper*(nper + 1)*face*vn)*v*v
+
+    return pv, dpv, d2pv
+
+
+def solve_ytm(price : float = 100.00, coupon : float = 0.0, face : float = 100.00, nper : int = 1, guess : float = 0.05, tol : float = 1e-12, maxiter : int = 50) -> float:
+    """Solves for the per-period yield at which a bond's cash flows are worth its price.
+
+    Parameters
+    ----------
+    price : float = 100.00
+        The bond's price.
+    coupon : float = 0.0
+        The per-period coupon rate of the bond.
+    face : float = 100.00
+        The bond's face value, or principal amount repaid at maturity.
+    nper : int = 1
+        The number of payment periods.
+    guess : float = 0.05
+        The initial estimate of the yield.
+    tol : float = 1e-12
+        The step size below which the iteration is considered converged.
+    maxiter : int = 50
+        The maximum number of iterations.
+
+    Returns
+    -------
+    float
+        The per-period YTM of the bond, as a decimal.
+    """
+
+    y = guess
+    for _ in range(maxiter): # Halley's method on PV(y) - price, using the analytic derivatives of PV
+        pv, fp, fpp = npv_and_derivatives(y, coupon, face, nper)
+        f = pv - price
+        dy = 2*f*fp/(2*fp*fp - f*fpp)
+        y -= dy
+        if abs(dy) < tol:
+            return y
+
+    raise RuntimeError("YTM failed to converge after {} iterations.".format(maxiter))
+
+
+def macaulay_duration(apr : float = 0.0, coupon : float = 0.0, face : float = 100.00, freq : int = 1, maturity : int = 1, price : float = 100.00) -> float:
+    """Calculates the Macaulay Duration of a bond.
+
+    Parameters
+    ----------
+    apr : float = 0.0
+        The bond's APR, or the value y in the Macaulay Duration formula.
+    coupon : float = 0.0
+        The annual coupon rate of the bond.
+    face : float = 100.00
+        The bond's face value.
+    freq : int = 1
+        The number of compounding periods in a year, or the value k in the Macaulay Duration formula.
+    maturity : int = 1
+        The bond's maturity, in years.
+    price : float = 100.00
+        The bond price, the value P_B in the Macaulay Duration formula.
+
+    Returns
+    -------
+    float
+        The Macaulay Duration of the bond.
+    """
+
+    discount = apr/freq
+    nper = freq*maturity
+    vn, _, a_t, _ = _annuity_factors(discount, nper)
+
+    return ((coupon/freq)*face*a_t + nper*face*vn)/(freq*price) # Closed form of Macaulay Duration formula
+
+
+def convexity(apr : float = 0.0, coupon : float = 0.0, face : float = 100.00, freq : int = 1, maturity : int = 1, price : float = 100.00) -> float:
+    """Calculates the convexity of an option-free bond.
+
+    Parameters
+    ----------
+    apr : float = 0.0
+        The bond's APR, or the value y in the Macaulay Duration formula.
+    coupon : float = 0.0
+        The annual coupon rate of the bond.
+    face : float = 100.00
+        The bond's face value.
+    freq : int = 1
+        The number of compounding periods in a year, or the value k in the Macaulay Duration formula.
+    maturity : int = 1
+        The bond's maturity, in years.
+    price : float = 100.00
+        The bond price, the value P_B in the Macaulay Duration formula.
+
+    Returns
+    -------
+    float
+        The convexity of the bond.
+    """
+
+    discount = apr/freq
+    nper = freq*maturity
+    vn, _, _, a_tt = _annuity_factors(discount, nper)
+    v = 1/(1 + discount)
+
+    return ((coupon/freq)*face*a_tt + nper*(nper + 1)*face*vn)*v*v/(freq*freq*price) # Closed form of Convexity formula
+
+
+def duration_convexity(yld : float = 0.0, coupon : float = 0.0, face : float = 100.00, freq : int = 1, maturity : int = 1) -> tuple:
+    """Calculates the Macaulay Duration, modified duration, and convexity of a bond priced at its yield.
+
+    Parameters
+    ----------
+    yld : float = 0.0
+        The bond equivalent yield of the bond.
+    coupon : float = 0.0
+        The annual coupon rate of the bond.
+    face : float = 100.00
+        The bond's face value.
+    freq : int = 1
+        The number of coupon payments in a year.
+    maturity : int = 1
+        The bond's maturity, in years.
+
+    Returns
+    -------
+    tuple
+        The Macaulay Duration, modified duration, and convexity of the bond, in this order.
+    """
+
+    price = npv_cash_flows(yld/freq, coupon/freq, face, freq*maturity)
+
+    d = macaulay_duration(yld, coupon, face, freq, maturity, price)
+    d_m = d/(1 + (yld/freq))
+    c_0 = convexity(yld, coupon, face, freq, maturity, price)
+    return d, d_m, c_0